@@ -31,7 +31,15 @@ class ChatEvents:
     def add(
         self, event: UiPathConversationMessageEvent
     ) -> UiPathConversationMessage | None:
-        """Process an incoming conversation-level event and return the current message snapshot if applicable."""
+        """Process an incoming conversation-level event and return the current message snapshot if applicable.
+
+        The returned message is the live aggregate and keeps changing as later
+        events for the same message arrive; copy it if it must outlive the call.
+        """
+        # Keep-alive events carry nothing to aggregate
+        if not (event.start or event.end or event.content_part or event.tool_call):
+            return self.messages.get(event.message_id)
+
         msg = self.messages.get(event.message_id)
 
         if not msg:
@@ -167,13 +175,16 @@ class ChatEvents:
 
 def get_user_message(user_text: str) -> UiPathConversationMessage:
     """Build a user message from text input."""
+    message_id, content_part_id = str(uuid4()), str(uuid4())
+    timestamp = datetime.now().isoformat()
+
     return UiPathConversationMessage(
-        message_id=str(uuid4()),
-        created_at=datetime.now().isoformat(),
-        updated_at=datetime.now().isoformat(),
+        message_id=message_id,
+        created_at=timestamp,
+        updated_at=timestamp,
         content_parts=[
             UiPathConversationContentPart(
-                content_part_id=str(uuid4()),
+                content_part_id=content_part_id,
                 mime_type="text/plain",
                 data=UiPathInlineValue(inline=user_text),
             )
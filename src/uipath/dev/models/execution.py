@@ -1,10 +1,12 @@
 """Models for representing execution runs and their data."""
 
 import os
+import secrets
+import time
+from collections import deque
 from datetime import datetime
 from enum import Enum
 from typing import Any, cast
-from uuid import uuid4
 
 from rich.text import Text
 from uipath.core.chat import UiPathConversationMessage, UiPathConversationMessageEvent
@@ -13,6 +15,19 @@ from uipath.runtime.errors import UiPathErrorContract
 from uipath.dev.models.chat import ChatEvents
 from uipath.dev.models.messages import LogMessage, TraceMessage
 
+# Oldest log entries are dropped once a run holds this many
+MAX_RUN_LOGS = 5000
+
+# Run status -> (color, icon) used by ExecutionRun.display_name
+STATUS_STYLES: dict[str, tuple[str, str]] = {
+    "pending": ("grey50", "●"),
+    "running": ("yellow", "▶"),
+    "suspended": ("cyan", "⏸"),
+    "completed": ("green", "✔"),
+    "failed": ("red", "✖"),
+}
+DEFAULT_STATUS_STYLE = ("white", "?")
+
 
 class ExecutionMode(Enum):
     """Enumeration of execution modes."""
@@ -32,63 +47,85 @@ class ExecutionRun:
         mode: ExecutionMode,
     ):
         """Initialize an ExecutionRun instance."""
-        self.id = str(uuid4())[:8]
+        self.id = secrets.token_hex(4)
         self.entrypoint = entrypoint
         self.input_data = input_data
         self.mode = mode
         self.resume_data: Any | None = None
         self.output_data: dict[str, Any] | str | None = None
+        self._elapsed: float | None = None  # Fixed once the run has an end time
+        self._end_time: datetime | None = None
         self.start_time = datetime.now()
-        self.end_time: datetime | None = None
         self.status = "pending"  # pending, running, completed, failed, suspended
         self.traces: list[TraceMessage] = []
-        self.logs: list[LogMessage] = []
+        self._trace_index: dict[str, int] = {}  # span_id -> position in traces
+        self.logs: deque[LogMessage] = deque(maxlen=MAX_RUN_LOGS)
         self.error: UiPathErrorContract | None = None
         self.chat_events = ChatEvents()
+        # Last display_name and the (status, start, duration) it was built for
+        self._display_cache: tuple[tuple[str, datetime, str], Text] | None = None
+
+    @property
+    def start_time(self) -> datetime:
+        """Get the time the run (or its latest resume) started."""
+        return self._start_time
+
+    @start_time.setter
+    def start_time(self, value: datetime) -> None:
+        self._start_time = value
+        # Anchor on the monotonic clock so a running duration is a subtraction
+        self._start_monotonic = time.monotonic() - (
+            (datetime.now() - value).total_seconds()
+        )
+        self._update_elapsed()
+
+    @property
+    def end_time(self) -> datetime | None:
+        """Get the time the run finished, if it has."""
+        return self._end_time
+
+    @end_time.setter
+    def end_time(self, value: datetime | None) -> None:
+        self._end_time = value
+        self._update_elapsed()
+
+    def _update_elapsed(self) -> None:
+        """Recompute the final elapsed seconds after a start/end change."""
+        if self._end_time is None:
+            self._elapsed = None
+        else:
+            self._elapsed = (self._end_time - self._start_time).total_seconds()
 
     @property
     def duration(self) -> str:
         """Get the duration of the run as a formatted string."""
-        if self.end_time:
-            delta = self.end_time - self.start_time
-            return f"{delta.total_seconds():.1f}s"
-        elif self.start_time:
-            delta = datetime.now() - self.start_time
-            return f"{delta.total_seconds():.1f}s"
-        return "0.0s"
+        if self._elapsed is not None:
+            return f"{self._elapsed:.1f}s"
+        return f"{time.monotonic() - self._start_monotonic:.1f}s"
 
     @property
     def display_name(self) -> Text:
         """Get a rich Text representation of the run for display."""
-        status_colors = {
-            "pending": "grey50",
-            "running": "yellow",
-            "suspended": "cyan",
-            "completed": "green",
-            "failed": "red",
-        }
-
-        status_icon = {
-            "pending": "●",
-            "running": "▶",
-            "suspended": "⏸",
-            "completed": "✔",
-            "failed": "✖",
-        }.get(self.status, "?")
+        duration_str = self.duration[:6]
+        cache_key = (self.status, self.start_time, duration_str)
+        if self._display_cache is not None and self._display_cache[0] == cache_key:
+            return self._display_cache[1]
+
+        status_color, status_icon = STATUS_STYLES.get(self.status, DEFAULT_STATUS_STYLE)
 
         script_name = (
             os.path.basename(self.entrypoint) if self.entrypoint else "untitled"
         )
         truncated_script = script_name[:8]
         time_str = self.start_time.strftime("%H:%M:%S")
-        duration_str = self.duration[:6]
 
         text = Text()
-        text.append(f"{status_icon:<2} ", style=status_colors.get(self.status, "white"))
+        text.append(f"{status_icon:<2} ", style=status_color)
         text.append(f"{truncated_script:<8} ")
         text.append(f"({time_str:<8}) ")
         text.append(f"[{duration_str:<6}]")
 
+        self._display_cache = (cache_key, text)
         return text
 
     @property
@@ -101,3 +138,17 @@ class ExecutionRun:
         if event is None:
             return None
         return self.chat_events.add(cast(UiPathConversationMessageEvent, event))
+
+    def add_trace(self, trace_msg: TraceMessage) -> None:
+        """Add a trace span, replacing any earlier version of the same span."""
+        index = self._trace_index.get(trace_msg.span_id)
+        if index is None:
+            self._trace_index[trace_msg.span_id] = len(self.traces)
+            self.traces.append(trace_msg)
+        else:
+            self.traces[index] = trace_msg
+
+    def get_trace(self, span_id: str) -> TraceMessage | None:
+        """Get the latest version of a trace span by its id."""
+        index = self._trace_index.get(span_id)
+        return None if index is None else self.traces[index]
@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
+import time
 import traceback
 from datetime import datetime
 from typing import Any, Callable, cast
@@ -37,6 +39,9 @@ LogCallback = Callable[[LogMessage], None]
 TraceCallback = Callable[[TraceMessage], None]
 ChatCallback = Callable[[ChatMessage], None]
 
+# Minimum delay between run updates triggered by logs and traces (~one frame)
+RUN_UPDATE_INTERVAL = 1 / 30
+
 
 class RunService:
     """Orchestrates execution runs and keeps ExecutionRun state in sync.
@@ -76,6 +81,10 @@ class RunService:
 
         self.debug_bridges: dict[str, TextualDebugBridge] = {}
 
+        self._dirty_runs: set[str] = set()
+        self._flush_handle: asyncio.TimerHandle | None = None
+        self._last_emit: dict[str, float] = {}
+
     def register_run(self, run: ExecutionRun) -> None:
         """Register a new run and emit an initial update."""
         self.runs[run.id] = run
@@ -86,7 +95,7 @@ class RunService:
         return self.runs.get(run_id)
 
     async def execute(self, run: ExecutionRun) -> None:
-        """Execute or resume a run."""
+        """Execute or resume a run previously added with register_run."""
         new_runtime: UiPathRuntimeProtocol | None = None
         try:
             execution_input: dict[str, Any] | str | None = {}
@@ -192,25 +201,24 @@ class RunService:
             run.end_time = datetime.now()
 
         except UiPathRuntimeError as e:
-            self._add_error_log(run)
+            self._add_error_log(run, exc=e)
             run.status = "failed"
             run.end_time = datetime.now()
             run.error = e.error_info
 
         except Exception as e:
-            self._add_error_log(run)
+            self._add_error_log(run, exc=e)
             run.status = "failed"
             run.end_time = datetime.now()
             run.error = UiPathErrorContract(
                 code="Unknown",
                 title=str(e),
-                detail=traceback.format_exc(),
+                detail="".join(traceback.format_exception(e)),
             )
         finally:
             if new_runtime is not None:
                 await new_runtime.dispose()
 
-        self.runs[run.id] = run
         self._emit_run_updated(run)
 
         if run.id in self.debug_bridges:
@@ -257,7 +265,7 @@ class RunService:
         run = self.runs.get(log_msg.run_id)
         if run is not None:
             run.logs.append(log_msg)
-            self._emit_run_updated(run)
+            self._schedule_run_updated(run)
 
         if self.on_log is not None:
             self.on_log(log_msg)
@@ -266,15 +274,8 @@ class RunService:
         """Entry point for traces (from RunContextExporter)."""
         run = self.runs.get(trace_msg.run_id)
         if run is not None:
-            # Update or append trace
-            for i, existing_trace in enumerate(run.traces):
-                if existing_trace.span_id == trace_msg.span_id:
-                    run.traces[i] = trace_msg
-                    break
-            else:
-                run.traces.append(trace_msg)
-
-            self._emit_run_updated(run)
+            run.add_trace(trace_msg)
+            self._schedule_run_updated(run)
 
         if self.on_trace is not None:
             self.on_trace(trace_msg)
@@ -303,9 +304,45 @@ class RunService:
             run.status = "suspended"
             self._emit_run_updated(run)
 
+    def _schedule_run_updated(self, run: ExecutionRun) -> None:
+        """Coalesce frequent run updates (logs, traces) into one per interval."""
+        if self.on_run_updated is None:
+            return
+
+        # Leading edge: a quiet run is notified right away
+        if run.id not in self._dirty_runs and (
+            time.monotonic() - self._last_emit.get(run.id, 0.0) >= RUN_UPDATE_INTERVAL
+        ):
+            self._emit_run_updated(run)
+            return
+
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # Not on the event loop thread, nothing to coalesce against
+            self._emit_run_updated(run)
+            return
+
+        self._dirty_runs.add(run.id)
+        if self._flush_handle is None:
+            self._flush_handle = loop.call_later(
+                RUN_UPDATE_INTERVAL, self._flush_run_updates
+            )
+
+    def _flush_run_updates(self) -> None:
+        """Emit one update for every run changed since the last flush."""
+        self._flush_handle = None
+        dirty_runs, self._dirty_runs = self._dirty_runs, set()
+        for run_id in dirty_runs:
+            run = self.runs.get(run_id)
+            if run is not None:
+                self._emit_run_updated(run)
+
     def _emit_run_updated(self, run: ExecutionRun) -> None:
         """Notify observers that a run's state changed."""
-        self.runs[run.id] = run
+        # An immediate update supersedes any pending coalesced one
+        self._dirty_runs.discard(run.id)
+        self._last_emit[run.id] = time.monotonic()
         if self.on_run_updated is not None:
             self.on_run_updated(run)
 
@@ -318,14 +355,29 @@ class RunService:
         )
         self.handle_log(log_msg)
 
-    def _add_error_log(self, run: ExecutionRun, error: str | None = None) -> None:
+    def _add_error_log(
+        self,
+        run: ExecutionRun,
+        error: str | None = None,
+        exc: BaseException | None = None,
+    ) -> None:
         if error is None:
             from rich.traceback import Traceback
 
-            tb = Traceback(
-                show_locals=False,
-                max_frames=4,
-            )
+            if exc is not None:
+                # Build from the caught exception instead of re-reading sys.exc_info()
+                tb = Traceback.from_exception(
+                    type(exc),
+                    exc,
+                    exc.__traceback__,
+                    show_locals=False,
+                    max_frames=4,
+                )
+            else:
+                tb = Traceback(
+                    show_locals=False,
+                    max_frames=4,
+                )
             log_msg = LogMessage(
                 run_id=run.id,
                 level="ERROR",
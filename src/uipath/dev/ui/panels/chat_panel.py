@@ -7,6 +7,7 @@ from textual.app import ComposeResult
 from textual.containers import Container, Vertical, VerticalScroll
 from textual.widgets import Input, Markdown
 from uipath.core.chat import (
+    UiPathConversationMessage,
     UiPathExternalValue,
     UiPathInlineValue,
 )
@@ -39,6 +40,40 @@ class Tool(Markdown):
     BORDER_TITLE = "🛠️  tool"
 
 
+# Bubble type per message role; unknown roles render as responses
+ROLE_WIDGETS: dict[str, type[Prompt] | type[Response]] = {
+    "user": Prompt,
+    "assistant": Response,
+}
+
+
+def _render_message(
+    message: UiPathConversationMessage,
+) -> tuple[type[Prompt] | type[Response] | type[Tool], str]:
+    """Pick the bubble class for a message and render its Markdown content."""
+    parts: list[str] = []
+    for part in message.content_parts or ():
+        if not (
+            part.mime_type.startswith("text/") or part.mime_type == "application/json"
+        ):
+            continue
+        if isinstance(part.data, UiPathInlineValue):
+            parts.append(part.data.inline or "")
+        elif isinstance(part.data, UiPathExternalValue):
+            parts.append(f"[external: {part.data.uri}]")
+    text_block = "\n".join(parts).strip()
+
+    if not message.tool_calls:
+        return ROLE_WIDGETS.get(message.role, Response), text_block
+
+    tool_lines = [
+        f" {'✓' if call.result else '⚙'} **{call.name}**" for call in message.tool_calls
+    ]
+    if text_block:
+        tool_lines.insert(0, text_block)
+    return Tool, "\n\n".join(tool_lines)
+
+
 class ChatPanel(Container):
     """Panel for displaying and interacting with chat messages."""
 
@@ -80,11 +115,27 @@ class ChatPanel(Container):
         self._last_content.clear()
         self._chat_order.clear()
 
-        for chat_msg in run.messages:
-            self.add_chat_message(
-                ChatMessage(message=chat_msg, event=None, run_id=run.id),
-                auto_scroll=False,
-            )
+        # Render only the newest MAX_WIDGETS bubbles, newest first
+        rendered: list[tuple[str, Markdown, str]] = []
+        for message in reversed(run.messages):
+            widget_cls, content = _render_message(message)
+            if not content:
+                continue
+            rendered.append((message.message_id, widget_cls(content), content))
+            if len(rendered) == MAX_WIDGETS:
+                break
+        rendered.reverse()
+
+        now = time.monotonic()
+        for message_id, widget, content in rendered:
+            self._chat_widgets[message_id] = widget
+            self._last_update_time[message_id] = now
+            self._last_content[message_id] = content
+            self._chat_order.append(message_id)
+
+        # One mount for the whole history instead of one per message
+        if rendered:
+            self._chat_view.mount_all(widget for _, widget, _ in rendered)
 
         # For a fresh run, always show the latest messages
         self._chat_view.scroll_end(animate=False)
@@ -106,40 +157,10 @@ class ChatPanel(Container):
 
         message_id = message.message_id
 
-        widget_cls: type[Prompt] | type[Response] | type[Tool]
-        if message.role == "user":
-            widget_cls = Prompt
-        elif message.role == "assistant":
-            widget_cls = Response
-        else:
-            widget_cls = Response
-
-        parts: list[str] = []
-        if message.content_parts:
-            for part in message.content_parts:
-                if (
-                    part.mime_type.startswith("text/")
-                    or part.mime_type == "application/json"
-                ):
-                    if isinstance(part.data, UiPathInlineValue):
-                        parts.append(part.data.inline or "")
-                    elif isinstance(part.data, UiPathExternalValue):
-                        parts.append(f"[external: {part.data.uri}]")
-
-        text_block = "\n".join(parts).strip()
-        content_lines = [f"{text_block}"] if text_block else []
-
-        if message.tool_calls:
-            widget_cls = Tool
-            for call in message.tool_calls:
-                status_icon = "✓" if call.result else "⚙"
-                content_lines.append(f" {status_icon} **{call.name}**")
-
-        if not content_lines:
+        widget_cls, content = _render_message(message)
+        if not content:
             return
 
-        content = "\n\n".join(content_lines)
-
         prev_content = self._last_content.get(message_id)
         if prev_content is not None and content == prev_content:
             # We already rendered this exact content, no need to touch the UI.
@@ -33,6 +33,9 @@ class NewRunPanel(Container):
 
         self.entrypoint_schemas: dict[str, dict[str, Any]] = {}
 
+        # Rendered mock input per entrypoint, reused on reselect and reset
+        self._mock_inputs: dict[str, str] = {}
+
         self.initial_input: str = "{}"
 
     def compose(self) -> ComposeResult:
@@ -142,9 +145,7 @@ class NewRunPanel(Container):
                 if runtime is not None:
                     await runtime.dispose()
 
-        # Generate mock JSON from schema
-        mock_data = mock_json_from_schema(schema)
-        json_input.text = json.dumps(mock_data, indent=2)
+        json_input.text = self._mock_input(entrypoint, schema)
 
     async def on_select_changed(self, event: Select.Changed) -> None:
         """Update JSON input when user selects an entrypoint."""
@@ -178,7 +179,12 @@ class NewRunPanel(Container):
         if schema is None:
             json_input.text = "{}"
         else:
-            json_input.text = json.dumps(
-                mock_json_from_schema(schema),
-                indent=2,
-            )
+            json_input.text = self._mock_input(self.selected_entrypoint, schema)
+
+    def _mock_input(self, entrypoint: str, schema: dict[str, Any]) -> str:
+        """Return the mock JSON input for an entrypoint, rendering it once."""
+        text = self._mock_inputs.get(entrypoint)
+        if text is None:
+            text = json.dumps(mock_json_from_schema(schema), indent=2)
+            self._mock_inputs[entrypoint] = text
+        return text
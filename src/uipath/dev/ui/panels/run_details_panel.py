@@ -1,10 +1,16 @@
 """Panel for displaying execution run details, traces, and logs."""
 
+from collections import defaultdict
+from datetime import datetime
+from itertools import islice
 from typing import Any
 
+from rich.errors import MarkupError
+from rich.text import Text
 from textual.app import ComposeResult
 from textual.containers import Container, Horizontal, Vertical
 from textual.reactive import reactive
+from textual.timer import Timer
 from textual.widgets import (
     Button,
     RichLog,
@@ -18,6 +24,81 @@ from uipath.dev.models.execution import ExecutionMode, ExecutionRun
 from uipath.dev.models.messages import ChatMessage, LogMessage, TraceMessage
 from uipath.dev.ui.panels.chat_panel import ChatPanel
 
+# Seconds buffered logs and traces for the shown run wait before being written
+FLUSH_DELAY = 0.05
+
+# Span status -> tree icon (statuses arrive lowercase from the exporter)
+SPAN_STATUS_ICONS: dict[str, str] = {
+    "started": "🔵",
+    "running": "🟡",
+    "completed": "🟢",
+    "failed": "🔴",
+    "error": "🔴",
+}
+DEFAULT_SPAN_ICON = "⚪"
+
+# Run/span status -> markup color
+STATUS_COLORS: dict[str, str] = {
+    "started": "blue",
+    "running": "yellow",
+    "completed": "green",
+    "failed": "red",
+    "error": "red",
+}
+
+# Log level -> markup color
+LOG_LEVEL_COLORS: dict[str, str] = {
+    "DEBUG": "dim cyan",
+    "INFO": "blue",
+    "WARN": "yellow",
+    "WARNING": "yellow",
+    "ERROR": "red",
+    "CRITICAL": "bold red",
+}
+
+
+def _format_time(value: datetime, millis: bool = False) -> str:
+    """Format HH:MM:SS[.mmm] from the datetime fields, skipping strftime."""
+    text = f"{value.hour:02d}:{value.minute:02d}:{value.second:02d}"
+    if millis:
+        text = f"{text}.{value.microsecond // 1000:03d}"
+    return text
+
+
+def _format_datetime(value: datetime) -> str:
+    """Format YYYY-MM-DD HH:MM:SS.mmm from the datetime fields."""
+    return (
+        f"{value.year:04d}-{value.month:02d}-{value.day:02d} "
+        f"{_format_time(value, millis=True)}"
+    )
+
+
+def _markup_text(markup: str) -> Text:
+    """Parse markup, falling back to plain text when it is not valid markup."""
+    try:
+        return Text.from_markup(markup)
+    except MarkupError:
+        return Text(markup)
+
+
+def _join_lines(log: RichLog, lines: list[Text]) -> Text:
+    """Join lines into one Text for a single write to log.
+
+    Text is not highlighted by RichLog.write, so the log's highlighter is
+    applied here.
+    """
+    text = Text("\n").join(lines)
+    return log.highlighter(text) if log.highlight else text
+
+
+def _markup_lines(log: RichLog, lines: list[str]) -> Text:
+    """Parse each markup line on its own and join them for a single write.
+
+    Parsing per line keeps an unclosed tag from styling the lines after it,
+    as with one write per line.
+    """
+    return _join_lines(log, [_markup_text(line) for line in lines])
+
 
 class SpanDetailsDisplay(Container):
     """Widget to display details of a selected span."""
@@ -35,45 +116,36 @@ class SpanDetailsDisplay(Container):
     def show_span_details(self, trace_msg: TraceMessage):
         """Display detailed information about a trace span."""
         details_log = self.query_one("#span-details", RichLog)
-        details_log.clear()
 
-        details_log.write(f"[bold cyan]Span: {trace_msg.span_name}[/bold cyan]")
+        lines = [f"[bold cyan]Span: {trace_msg.span_name}[/bold cyan]", ""]
 
-        details_log.write("")
+        color = STATUS_COLORS.get(trace_msg.status.lower(), "white")
+        lines.append(f"Status: [{color}]{trace_msg.status.upper()}[/{color}]")
 
-        color_map = {
-            "started": "blue",
-            "running": "yellow",
-            "completed": "green",
-            "failed": "red",
-            "error": "red",
-        }
-        color = color_map.get(trace_msg.status.lower(), "white")
-        details_log.write(f"Status: [{color}]{trace_msg.status.upper()}[/{color}]")
-
-        details_log.write(
-            f"Started: [dim]{trace_msg.timestamp.strftime('%H:%M:%S.%f')[:-3]}[/dim]"
+        lines.append(
+            f"Started: [dim]{_format_time(trace_msg.timestamp, millis=True)}[/dim]"
         )
 
         if trace_msg.duration_ms is not None:
-            details_log.write(
-                f"Duration: [yellow]{trace_msg.duration_ms:.2f}ms[/yellow]"
-            )
+            lines.append(f"Duration: [yellow]{trace_msg.duration_ms:.2f}ms[/yellow]")
 
         if trace_msg.attributes:
-            details_log.write("")
-            details_log.write("[bold]Attributes:[/bold]")
+            lines.append("")
+            lines.append("[bold]Attributes:[/bold]")
             for key, value in trace_msg.attributes.items():
-                details_log.write(f"  {key}: {value}")
+                lines.append(f"  {key}: {value}")
 
-        details_log.write("")
+        lines.append("")
 
-        details_log.write(f"[dim]Trace ID: {trace_msg.trace_id}[/dim]")
-        details_log.write(f"[dim]Span ID: {trace_msg.span_id}[/dim]")
-        details_log.write(f"[dim]Run ID: {trace_msg.run_id}[/dim]")
+        lines.append(f"[dim]Trace ID: {trace_msg.trace_id}[/dim]")
+        lines.append(f"[dim]Span ID: {trace_msg.span_id}[/dim]")
+        lines.append(f"[dim]Run ID: {trace_msg.run_id}[/dim]")
 
         if trace_msg.parent_span_id:
-            details_log.write(f"[dim]Parent Span: {trace_msg.parent_span_id}[/dim]")
+            lines.append(f"[dim]Parent Span: {trace_msg.parent_span_id}[/dim]")
+
+        details_log.clear()
+        details_log.write(_markup_lines(details_log, lines))
 
 
 class RunDetailsPanel(Container):
@@ -85,12 +157,20 @@ class RunDetailsPanel(Container):
         """Initialize RunDetailsPanel."""
         super().__init__(**kwargs)
         self.span_tree_nodes = {}
+        # Top-level span nodes keyed by the parent span they are still waiting for
+        self._orphan_nodes: dict[str, list[TreeNode[str]]] = {}
         self.current_run = None
         self._chat_panel: ChatPanel | None = None
         self._spans_tree: Tree[Any] | None = None
         self._logs: RichLog | None = None
         self._details: RichLog | None = None
         self._debug_controls: Container | None = None
+        # Fields the Details tab was last rendered from
+        self._details_key: tuple[Any, ...] | None = None
+        # Pending updates for the shown run, written once per flush
+        self._log_buffer: list[LogMessage] = []
+        self._trace_buffer: dict[str, TraceMessage] = {}
+        self._flush_timer: Timer | None = None
 
     def compose(self) -> ComposeResult:
         """Compose the UI layout."""
@@ -159,10 +239,9 @@ class RunDetailsPanel(Container):
         self, old_value: ExecutionRun | None, new_value: ExecutionRun | None
     ):
         """Watch for changes to the current run."""
-        if new_value is not None:
-            if old_value != new_value:
-                self.current_run = new_value
-                self.show_run(new_value)
+        # The reactive is already set when this runs; assigning it again is redundant
+        if new_value is not None and old_value != new_value:
+            self.show_run(new_value)
 
     def update_run(self, run: ExecutionRun):
         """Update the displayed run information."""
@@ -176,9 +255,15 @@ class RunDetailsPanel(Container):
 
         self._show_run_chat(run)
 
+        # The run already holds everything that was buffered
+        self._log_buffer.clear()
+        self._trace_buffer.clear()
+
         self._logs.clear()
-        for log in run.logs:
-            self.add_log(log)
+        # Each entry takes at least one line, so older ones would be trimmed anyway
+        max_lines = self._logs.max_lines
+        skip = max(0, len(run.logs) - max_lines) if max_lines else 0
+        self._write_logs(list(islice(run.logs, skip, None)))
 
         self._rebuild_spans_tree()
 
@@ -240,48 +325,59 @@ class RunDetailsPanel(Container):
 
         return lines
 
-    def _write_block(
-        self, log: RichLog, title: str, data: object, style: str = "white"
-    ) -> None:
+    def _block_lines(self, title: str, data: object, style: str = "white") -> list[str]:
         """Pretty-print a block with flattened dot-notation paths."""
-        log.write(f"[bold {style}]{title.upper()}:[/bold {style}]")
-        log.write("[dim]" + "=" * 50 + "[/dim]")
-
-        for line in self._flatten_values(data):
-            log.write(line)
-
-        log.write("")
+        return [
+            f"[bold {style}]{title.upper()}:[/bold {style}]",
+            "[dim]" + "=" * 50 + "[/dim]",
+            *self._flatten_values(data),
+            "",
+        ]
 
     def _show_run_details(self, run: ExecutionRun):
         """Display detailed information about the run in the Details tab."""
         assert self._details is not None
 
-        self.update_debug_controls_visibility(run)
+        # Log/trace-only updates leave everything shown here untouched
+        details_key = (
+            run.id,
+            run.mode,
+            run.status,
+            run.start_time,
+            run.end_time,
+            id(run.input_data),
+            id(run.resume_data),
+            id(run.output_data),
+            id(run.error),
+        )
+        if details_key == self._details_key:
+            return
+        self._details_key = details_key
 
-        self._details.clear()
+        lines = self._details_lines(run)
 
-        self._details.write(f"[bold cyan]Run ID: {run.id}[/bold cyan]")
-        self._details.write("")
+        # One write inside one batch, instead of a repaint per line
+        with self.app.batch_update():
+            self.update_debug_controls_visibility(run)
+            self._details.clear()
+            self._details.write(_markup_lines(self._details, lines))
+
+    def _details_lines(self, run: ExecutionRun) -> list[str]:
+        """Build the markup lines shown in the Details tab."""
+        lines = [f"[bold cyan]Run ID: {run.id}[/bold cyan]", ""]
 
-        status_color_map = {
-            "started": "blue",
-            "running": "yellow",
-            "completed": "green",
-            "failed": "red",
-            "error": "red",
-        }
         status = getattr(run, "status", "unknown")
-        color = status_color_map.get(status.lower(), "white")
-        self._details.write(f"[bold]Status:[/bold] [{color}]{status.upper()}[/{color}]")
+        color = STATUS_COLORS.get(status.lower(), "white")
+        lines.append(f"[bold]Status:[/bold] [{color}]{status.upper()}[/{color}]")
 
         if hasattr(run, "start_time") and run.start_time:
-            self._details.write(
-                f"[bold]Started:[/bold] [dim]{run.start_time.strftime('%Y-%m-%d %H:%M:%S.%f')[:-3]}[/dim]"
+            lines.append(
+                f"[bold]Started:[/bold] [dim]{_format_datetime(run.start_time)}[/dim]"
             )
 
         if hasattr(run, "end_time") and run.end_time:
-            self._details.write(
-                f"[bold]Ended:[/bold] [dim]{run.end_time.strftime('%Y-%m-%d %H:%M:%S.%f')[:-3]}[/dim]"
+            lines.append(
+                f"[bold]Ended:[/bold] [dim]{_format_datetime(run.end_time)}[/dim]"
             )
 
         if (
@@ -291,29 +387,29 @@ class RunDetailsPanel(Container):
             and run.end_time
         ):
             duration = (run.end_time - run.start_time).total_seconds() * 1000
-            self._details.write(
-                f"[bold]Duration:[/bold] [yellow]{duration:.2f}ms[/yellow]"
-            )
+            lines.append(f"[bold]Duration:[/bold] [yellow]{duration:.2f}ms[/yellow]")
 
-        self._details.write("")
+        lines.append("")
 
         if hasattr(run, "input_data"):
-            self._write_block(self._details, "Input", run.input_data, style="green")
+            lines.extend(self._block_lines("Input", run.input_data, style="green"))
 
         if hasattr(run, "resume_data") and run.resume_data:
-            self._write_block(self._details, "Resume", run.resume_data, style="green")
+            lines.extend(self._block_lines("Resume", run.resume_data, style="green"))
 
         if hasattr(run, "output_data"):
-            self._write_block(self._details, "Output", run.output_data, style="magenta")
+            lines.extend(self._block_lines("Output", run.output_data, style="magenta"))
 
         if hasattr(run, "error") and run.error:
-            self._details.write("[bold red]ERROR:[/bold red]")
-            self._details.write("[dim]" + "=" * 50 + "[/dim]")
+            lines.append("[bold red]ERROR:[/bold red]")
+            lines.append("[dim]" + "=" * 50 + "[/dim]")
             if run.error.code:
-                self._details.write(f"[red]Code: {run.error.code}[/red]")
-            self._details.write(f"[red]Title: {run.error.title}[/red]")
-            self._details.write(f"[red]\n{run.error.detail}[/red]")
-            self._details.write("")
+                lines.append(f"[red]Code: {run.error.code}[/red]")
+            lines.append(f"[red]Title: {run.error.title}[/red]")
+            lines.append(f"[red]\n{run.error.detail}[/red]")
+            lines.append("")
+
+        return lines
 
     def _show_run_chat(self, run: ExecutionRun) -> None:
         assert self._chat_panel is not None
@@ -325,17 +421,19 @@ class RunDetailsPanel(Container):
         if self._spans_tree is None or self._spans_tree.root is None:
             return
 
-        self._spans_tree.root.remove_children()
+        with self.app.batch_update():
+            self._spans_tree.root.remove_children()
 
-        self.span_tree_nodes.clear()
+            self.span_tree_nodes.clear()
+            self._orphan_nodes.clear()
 
-        if not self.current_run or not self.current_run.traces:
-            return
+            if not self.current_run or not self.current_run.traces:
+                return
 
-        self._build_spans_tree(self.current_run.traces)
+            self._build_spans_tree(self.current_run.traces)
 
-        # Expand the root "Trace" node
-        self._spans_tree.root.expand()
+            # Expand the root "Trace" node
+            self._spans_tree.root.expand()
 
     def _build_spans_tree(self, trace_messages: list[TraceMessage]):
         """Build the spans tree from trace messages."""
@@ -343,29 +441,38 @@ class RunDetailsPanel(Container):
 
         root = self._spans_tree.root
 
-        # Filter out spans without parents (artificial root spans)
-        spans_by_id = {
-            msg.span_id: msg for msg in trace_messages if msg.parent_span_id is not None
-        }
-
-        # Build parent-to-children mapping once upfront
-        children_by_parent: dict[str, list[TraceMessage]] = {}
-        for msg in spans_by_id.values():
-            if msg.parent_span_id:
-                if msg.parent_span_id not in children_by_parent:
-                    children_by_parent[msg.parent_span_id] = []
-                children_by_parent[msg.parent_span_id].append(msg)
+        # Index spans and build the parent-to-children mapping in one pass
+        spans_by_id: dict[str, TraceMessage] = {}
+        children_by_parent: dict[str, list[TraceMessage]] = defaultdict(list)
+        for msg in trace_messages:
+            parent_span_id = msg.parent_span_id
+            # Filter out spans without parents (artificial root spans)
+            if parent_span_id is None:
+                continue
+            spans_by_id[msg.span_id] = msg
+            if parent_span_id:
+                children_by_parent[parent_span_id].append(msg)
+
+        # Sort every sibling group once, up front, so the build never re-sorts
+        for children in children_by_parent.values():
+            children.sort(key=lambda x: x.timestamp)
 
         # Find root spans (parent doesn't exist in our filtered data)
         root_spans = [
             msg
-            for msg in trace_messages
+            for msg in spans_by_id.values()
             if msg.parent_span_id and msg.parent_span_id not in spans_by_id
         ]
 
-        # Build tree recursively for each root span
-        for root_span in sorted(root_spans, key=lambda x: x.timestamp):
+        root_spans.sort(key=lambda x: x.timestamp)
+
+        # Build the subtree of each root span
+        for root_span in root_spans:
             self._add_span_with_children(root, root_span, children_by_parent)
+            if root_span.parent_span_id:
+                self._orphan_nodes.setdefault(root_span.parent_span_id, []).append(
+                    self.span_tree_nodes[root_span.span_id]
+                )
 
     def _add_span_with_children(
         self,
@@ -373,29 +480,104 @@ class RunDetailsPanel(Container):
         trace_msg: TraceMessage,
         children_by_parent: dict[str, list[TraceMessage]],
     ):
-        """Recursively add a span and all its children."""
-        color_map = {
-            "started": "🔵",
-            "running": "🟡",
-            "completed": "🟢",
-            "failed": "🔴",
-            "error": "🔴",
-        }
-        status_icon = color_map.get(trace_msg.status.lower(), "⚪")
-        duration_str = (
-            f" ({trace_msg.duration_ms:.1f}ms)" if trace_msg.duration_ms else ""
-        )
-        label = f"{status_icon} {trace_msg.span_name}{duration_str}"
+        """Add a span and all its descendants, depth first, without recursion."""
+        stack: list[tuple[TreeNode[str], TraceMessage]] = [(parent_node, trace_msg)]
+        while stack:
+            parent, msg = stack.pop()
+            # Created expanded, rather than expanding (and re-laying out) afterwards
+            node = parent.add(self._span_label(msg), msg.span_id, expand=True)
+            self.span_tree_nodes[msg.span_id] = node
+
+            # Children are presorted; pushed in reverse so they pop in order
+            children = children_by_parent.get(msg.span_id, ())
+            stack.extend((node, child) for child in reversed(children))
+
+    def _span_label(self, trace_msg: TraceMessage) -> Text:
+        """Build the tree label for a span; span names are shown as plain text."""
+        status_icon = SPAN_STATUS_ICONS.get(trace_msg.status)
+        if status_icon is None:
+            status_icon = SPAN_STATUS_ICONS.get(
+                trace_msg.status.lower(), DEFAULT_SPAN_ICON
+            )
+        if trace_msg.duration_ms:
+            return Text(
+                f"{status_icon} {trace_msg.span_name} ({trace_msg.duration_ms:.1f}ms)"
+            )
+        return Text(f"{status_icon} {trace_msg.span_name}")
 
-        node = parent_node.add(label)
-        node.data = trace_msg.span_id
-        self.span_tree_nodes[trace_msg.span_id] = node
-        node.expand()
+    def _insert_span(self, trace_msg: TraceMessage) -> None:
+        """Insert a single span into the existing tree, keeping timestamp order."""
+        assert self._spans_tree is not None
+
+        parent_span_id = trace_msg.parent_span_id
+        if parent_span_id is None:
+            # Artificial root spans are never shown
+            return
 
-        # Get children from prebuilt mapping - O(1) lookup
-        children = children_by_parent.get(trace_msg.span_id, [])
-        for child in sorted(children, key=lambda x: x.timestamp):
-            self._add_span_with_children(node, child, children_by_parent)
+        existing = self.span_tree_nodes.get(trace_msg.span_id)
+        if existing is not None:
+            existing.set_label(self._span_label(trace_msg))
+            return
+
+        root = self._spans_tree.root
+        parent_node = self.span_tree_nodes.get(parent_span_id)
+        if parent_node is None:
+            parent_node = root
+        node = parent_node.add(
+            self._span_label(trace_msg),
+            trace_msg.span_id,
+            before=self._span_position(parent_node, trace_msg.timestamp),
+            expand=True,
+        )
+        self.span_tree_nodes[trace_msg.span_id] = node
+        if parent_node is root:
+            self._orphan_nodes.setdefault(parent_span_id, []).append(node)
+            if not root.is_expanded:
+                root.expand()
+
+        # Spans are exported as they end, so children usually arrive first
+        for orphan in self._orphan_nodes.pop(trace_msg.span_id, []):
+            self._move_span_node(orphan, node)
+
+    def _span_position(
+        self, parent_node: TreeNode[str], timestamp: datetime
+    ) -> int | None:
+        """Find the child index a span starting at timestamp belongs before."""
+        assert self.current_run is not None
+
+        siblings = parent_node.children
+        index = len(siblings)
+        # New spans are almost always the latest, so scan from the end
+        while index > 0:
+            span_id = siblings[index - 1].data
+            sibling = self.current_run.get_trace(span_id) if span_id else None
+            if sibling is None or sibling.timestamp <= timestamp:
+                break
+            index -= 1
+        return None if index == len(siblings) else index
+
+    def _move_span_node(self, node: TreeNode[str], new_parent: TreeNode[str]) -> None:
+        """Re-create a span node and its subtree under a new parent."""
+        assert self.current_run is not None
+
+        trace_msg = self.current_run.get_trace(node.data) if node.data else None
+        position = (
+            self._span_position(new_parent, trace_msg.timestamp) if trace_msg else None
+        )
+        stack: list[tuple[TreeNode[str], TreeNode[str], int | None]] = [
+            (node, new_parent, position)
+        ]
+        while stack:
+            source, target, position = stack.pop()
+            copy = target.add(
+                source.label,
+                source.data,
+                before=position,
+                expand=source.is_expanded,
+            )
+            self.span_tree_nodes[source.data] = copy
+            stack.extend((child, copy, None) for child in reversed(source.children))
+        node.remove()
 
     def on_tree_node_selected(self, event: Tree.NodeSelected[str]) -> None:
         """Handle span selection in the tree."""
@@ -406,13 +588,9 @@ class RunDetailsPanel(Container):
         # Get the selected span data
         if hasattr(event.node, "data") and event.node.data:
             span_id = event.node.data
-            # Find the trace in current_run.traces
-            trace_msg = None
-            if self.current_run:
-                for trace in self.current_run.traces:
-                    if trace.span_id == span_id:
-                        trace_msg = trace
-                        break
+            trace_msg = (
+                self.current_run.get_trace(span_id) if self.current_run else None
+            )
 
             if trace_msg:
                 span_details_display = self.query_one(
@@ -444,38 +622,74 @@ class RunDetailsPanel(Container):
         if not self.current_run or trace_msg.run_id != self.current_run.id:
             return
 
-        # Rebuild the tree to include new trace
-        self._rebuild_spans_tree()
+        self._trace_buffer[trace_msg.span_id] = trace_msg
+        self._schedule_flush()
 
     def add_log(self, log_msg: LogMessage):
         """Add log to current run if it matches."""
-        assert self._logs is not None
-
         if not self.current_run or log_msg.run_id != self.current_run.id:
             return
 
-        color_map = {
-            "DEBUG": "dim cyan",
-            "INFO": "blue",
-            "WARN": "yellow",
-            "WARNING": "yellow",
-            "ERROR": "red",
-            "CRITICAL": "bold red",
-        }
-
-        color = color_map.get(log_msg.level.upper(), "white")
-        timestamp_str = log_msg.timestamp.strftime("%H:%M:%S")
-        level_short = log_msg.level[:4].upper()
+        self._log_buffer.append(log_msg)
+        self._schedule_flush()
 
-        if isinstance(log_msg.message, str):
-            log_text = (
-                f"[dim]{timestamp_str}[/dim] "
-                f"[{color}]{level_short}[/{color}] "
-                f"{log_msg.message}"
-            )
-            self._logs.write(log_text)
-        else:
+    def _schedule_flush(self) -> None:
+        """Arm a one-shot flush, unless one is already pending."""
+        if self._flush_timer is None:
+            self._flush_timer = self.set_timer(FLUSH_DELAY, self._flush_buffers)
+
+    def _flush_buffers(self) -> None:
+        """Write logs and traces buffered since the flush was armed."""
+        self._flush_timer = None
+        if not self._log_buffer and not self._trace_buffer:
+            return
+
+        logs, self._log_buffer = self._log_buffer, []
+        traces = list(self._trace_buffer.values())
+        self._trace_buffer.clear()
+
+        # Runs from a timer, so an error here would take down the whole app
+        with self.app.batch_update():
+            try:
+                self._write_logs(logs)
+            except Exception as e:
+                self.log.error(f"Failed to write logs: {e}")
+            for trace_msg in traces:
+                try:
+                    self._insert_span(trace_msg)
+                except Exception as e:
+                    self.log.error(f"Failed to add span {trace_msg.span_id}: {e}")
+
+    def _write_logs(self, logs: list[LogMessage]) -> None:
+        """Write log entries, joining consecutive text lines into one write."""
+        assert self._logs is not None
+
+        lines: list[Text] = []
+        for log_msg in logs:
+            if isinstance(log_msg.message, str):
+                lines.append(self._format_log(log_msg))
+                continue
+            if lines:
+                self._logs.write(_join_lines(self._logs, lines))
+                lines = []
             self._logs.write(log_msg.message)
+        if lines:
+            self._logs.write(_join_lines(self._logs, lines))
+
+    def _format_log(self, log_msg: LogMessage) -> Text:
+        """Format a text log entry as its own line of Text."""
+        color = LOG_LEVEL_COLORS.get(log_msg.level.upper(), "white")
+        timestamp_str = _format_time(log_msg.timestamp)
+        level_short = log_msg.level[:4].upper()
+
+        # The message is parsed on its own, so its tags end with the line
+        return Text.assemble(
+            (timestamp_str, "dim"),
+            " ",
+            (level_short, color),
+            " ",
+            _markup_text(str(log_msg.message)),
+        )
 
     def clear_display(self):
         """Clear both traces and logs display."""
@@ -489,6 +703,10 @@ class RunDetailsPanel(Container):
 
         self.current_run = None
         self.span_tree_nodes.clear()
+        self._orphan_nodes.clear()
+        self._details_key = None
+        self._log_buffer.clear()
+        self._trace_buffer.clear()
 
         span_details_display = self.query_one(
             "#span-details-display", SpanDetailsDisplay
@@ -499,4 +717,6 @@ class RunDetailsPanel(Container):
     def refresh_display(self):
         """Refresh the display with current run data."""
         if self.current_run:
+            # An explicit refresh always redraws the details, even for the same run
+            self._details_key = None
             self.show_run(self.current_run)
@@ -22,6 +22,14 @@ class RunHistoryPanel(Container):
         """Initialize RunHistoryPanel with empty run list."""
         super().__init__(**kwargs)
         self.runs: list[ExecutionRun] = []
+        self._runs_by_id: dict[str, ExecutionRun] = {}
+        # Ids of runs last seen running, so the periodic refresh skips the rest
+        self._running_ids: set[str] = set()
+        self._items_by_run_id: dict[str, ListItem] = {}
+        # Formatted label per run id, with the display_name it was built from
+        self._label_cache: dict[str, tuple[Text, Text]] = {}
+        # Label each list item currently shows, by run id
+        self._applied_labels: dict[str, Text] = {}
         self.selected_run: ExecutionRun | None = None
 
     def compose(self) -> ComposeResult:
@@ -44,29 +52,41 @@ class RunHistoryPanel(Container):
     def add_run(self, run: ExecutionRun) -> None:
         """Add a new run to history (at the top)."""
         self.runs.insert(0, run)
+        self._runs_by_id[run.id] = run
+        self._track_running(run)
         self._rebuild_list()
 
     def update_run(self, run: ExecutionRun) -> None:
         """Update an existing run's row (does not insert new runs)."""
-        for index, existing in enumerate(self.runs):
-            if existing.id == run.id:
-                self.runs[index] = run
-                self._update_list_item(run)
-                break
-        # If run not found, just ignore; creation is done via add_run()
+        existing = self._runs_by_id.get(run.id)
+        if existing is None:
+            # If run not found, just ignore; creation is done via add_run()
+            return
+
+        if existing is not run:
+            self.runs[self.runs.index(existing)] = run
+            self._runs_by_id[run.id] = run
+        self._track_running(run)
+        self._update_list_item(run)
 
     def get_run_by_id(self, run_id: str) -> ExecutionRun | None:
         """Get a run."""
-        for run in self.runs:
-            if run.id == run_id:
-                return run
-        return None
+        return self._runs_by_id.get(run_id)
 
     def clear_runs(self) -> None:
         """Clear all runs from history."""
         self.runs.clear()
+        self._runs_by_id.clear()
+        self._running_ids.clear()
+        self._label_cache.clear()
         self._rebuild_list()
 
+    def _track_running(self, run: ExecutionRun) -> None:
+        if run.status == "running":
+            self._running_ids.add(run.id)
+        else:
+            self._running_ids.discard(run.id)
+
     def _format_run_label(self, run: ExecutionRun) -> Text:
         """Format the label for a run item.
 
@@ -75,6 +95,12 @@ class RunHistoryPanel(Container):
         """
         base = run.display_name
 
+        # display_name returns the same object until its content changes
+        cached = self._label_cache.get(run.id)
+        if cached is not None and cached[0] is base:
+            return cached[1]
+        source = base
+
         # Ensure we have a Text object
         if not isinstance(base, Text):
             base = Text(str(base))
@@ -88,14 +114,18 @@ class RunHistoryPanel(Container):
         if not text.plain.startswith(" "):
             text = Text(" ") + text
 
+        self._label_cache[run.id] = (source, text)
         return text
 
     def _rebuild_list(self) -> None:
         run_list = self.query_one("#run-list", ListView)
         run_list.clear()
+        self._items_by_run_id.clear()
+        self._applied_labels.clear()
 
         for run in self.runs:
             item = self._create_list_item(run)
+            self._items_by_run_id[run.id] = item
             run_list.append(item)
 
     def _create_list_item(self, run: ExecutionRun) -> ListItem:
@@ -108,34 +138,43 @@ class RunHistoryPanel(Container):
 
     def _update_list_item(self, run: ExecutionRun) -> None:
         """Update only the ListItem corresponding to a single run."""
-        try:
-            run_list = self.query_one("#run-list", ListView)
-        except Exception:
+        item = self._items_by_run_id.get(run.id)
+        if item is None:
             return
 
-        for item in list(run_list.children):
-            run_id = getattr(item, "run_id", None)
-            if run_id != run.id:
-                continue
-
-            # Update label
-            try:
-                static = item.query_one(Static)
-                static.update(self._format_run_label(run))
-            except Exception:
-                continue
-
-            # Update status-related CSS class
-            new_classes = [cls for cls in item.classes if not cls.startswith("run-")]
-            new_classes.append(f"run-{run.status}")
-            item.set_classes(" ".join(new_classes))
-            break
+        label = self._format_run_label(run)
+
+        # Label and class changes land in a single refresh
+        with self.app.batch_update():
+            # Update label, unless it is the one already shown
+            if self._applied_labels.get(run.id) is not label:
+                try:
+                    static = item.query_one(Static)
+                    static.update(label)
+                except Exception:
+                    return
+                self._applied_labels[run.id] = label
+
+            # Update status-related CSS class, only when the status changed
+            status_class = f"run-{run.status}"
+            if not item.has_class(status_class):
+                item.remove_class(
+                    *[
+                        cls
+                        for cls in item.classes
+                        if cls.startswith("run-") and cls != "run-item"
+                    ]
+                )
+                item.add_class(status_class)
 
     def _refresh_running_items(self) -> None:
         """Refresh display names for running items only."""
-        if not any(run.status == "running" for run in self.runs):
+        if not self._running_ids:
             return None
 
-        for run in self.runs:
-            if run.status == "running":
-                self._update_list_item(run)
+        for run_id in list(self._running_ids):
+            run = self._runs_by_id.get(run_id)
+            if run is None or run.status != "running":
+                self._running_ids.discard(run_id)
+                continue
+            self._update_list_item(run)
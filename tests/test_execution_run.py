@@ -0,0 +1,39 @@
+from uipath.dev.models.execution import ExecutionMode, ExecutionRun
+from uipath.dev.models.messages import TraceMessage
+
+
+def _trace(run: ExecutionRun, span_id: str, status: str = "running") -> TraceMessage:
+    return TraceMessage(
+        run_id=run.id, span_name=span_id, span_id=span_id, status=status
+    )
+
+
+def test_add_trace_appends_new_spans_in_arrival_order() -> None:
+    run = ExecutionRun("main", {}, ExecutionMode.RUN)
+
+    for span_id in ("a", "b", "c"):
+        run.add_trace(_trace(run, span_id))
+
+    assert [t.span_id for t in run.traces] == ["a", "b", "c"]
+
+
+def test_add_trace_replaces_existing_span_in_place() -> None:
+    run = ExecutionRun("main", {}, ExecutionMode.RUN)
+    run.add_trace(_trace(run, "a"))
+    run.add_trace(_trace(run, "b"))
+
+    updated = _trace(run, "a", status="completed")
+    run.add_trace(updated)
+
+    assert [t.span_id for t in run.traces] == ["a", "b"]
+    assert run.traces[0] is updated
+
+
+def test_get_trace_returns_latest_version_or_none() -> None:
+    run = ExecutionRun("main", {}, ExecutionMode.RUN)
+    run.add_trace(_trace(run, "a"))
+    updated = _trace(run, "a", status="completed")
+    run.add_trace(updated)
+
+    assert run.get_trace("a") is updated
+    assert run.get_trace("missing") is None
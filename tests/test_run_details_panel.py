@@ -0,0 +1,156 @@
+import random
+from datetime import datetime, timedelta
+from typing import Any
+
+from textual.app import App, ComposeResult
+from textual.widgets.tree import TreeNode
+
+from uipath.dev.models.execution import ExecutionMode, ExecutionRun
+from uipath.dev.models.messages import TraceMessage
+from uipath.dev.ui.panels.run_details_panel import RunDetailsPanel
+
+ARTIFICIAL_ROOT_ID = "artificial-root"
+
+
+class PanelApp(App[None]):
+    def compose(self) -> ComposeResult:
+        yield RunDetailsPanel(id="panel")
+
+
+def _snapshot(node: TreeNode[Any]) -> list[tuple[str, Any, list[Any]]]:
+    return [(str(child.label), child.data, _snapshot(child)) for child in node.children]
+
+
+def _assert_matches_rebuild(panel: RunDetailsPanel) -> None:
+    assert panel._spans_tree is not None
+    root = panel._spans_tree.root
+    incremental = _snapshot(root)
+    for span_id, node in panel.span_tree_nodes.items():
+        assert node.data == span_id
+        assert node.tree is panel._spans_tree
+
+    panel._rebuild_spans_tree()
+
+    assert incremental == _snapshot(root)
+
+
+def _span_set(run: ExecutionRun, rng: random.Random) -> list[TraceMessage]:
+    start = datetime(2026, 1, 1)
+    traces = [
+        TraceMessage(
+            run_id=run.id,
+            span_name="root",
+            span_id=ARTIFICIAL_ROOT_ID,
+            timestamp=start,
+        )
+    ]
+    for index in range(12):
+        parent = rng.choice(traces)
+        traces.append(
+            TraceMessage(
+                run_id=run.id,
+                span_name=f"span {index}",
+                span_id=f"span-{index}",
+                parent_span_id=parent.span_id,
+                status=rng.choice(["running", "completed", "failed"]),
+                timestamp=start + timedelta(milliseconds=rng.randrange(1, 10_000)),
+            )
+        )
+    return traces
+
+
+def _span(
+    run: ExecutionRun, start: datetime, span_id: str, parent: str, offset: int
+) -> TraceMessage:
+    return TraceMessage(
+        run_id=run.id,
+        span_name=span_id,
+        span_id=span_id,
+        parent_span_id=parent,
+        timestamp=start + timedelta(seconds=offset),
+    )
+
+
+async def _new_run(app: PanelApp, pilot: Any) -> tuple[RunDetailsPanel, ExecutionRun]:
+    panel = app.query_one("#panel", RunDetailsPanel)
+    run = ExecutionRun("main", {}, ExecutionMode.RUN)
+    panel.update_run(run)
+    await pilot.pause()
+    return panel, run
+
+
+def _deliver(
+    panel: RunDetailsPanel, run: ExecutionRun, batches: list[list[TraceMessage]]
+) -> None:
+    for batch in batches:
+        for trace_msg in batch:
+            run.add_trace(trace_msg)
+            panel.add_trace(trace_msg)
+        panel._flush_buffers()
+
+
+async def test_incremental_tree_matches_rebuild_for_shuffled_arrivals() -> None:
+    rng = random.Random(1234)
+    app = PanelApp()
+    async with app.run_test() as pilot:
+        for _ in range(30):
+            panel, run = await _new_run(app, pilot)
+            traces = _span_set(run, rng)
+            rng.shuffle(traces)
+            batches = []
+            while traces:
+                size = rng.randint(1, 4)
+                batches.append(traces[:size])
+                traces = traces[size:]
+
+            _deliver(panel, run, batches)
+
+            _assert_matches_rebuild(panel)
+
+
+async def test_child_before_parent_in_separate_flushes() -> None:
+    app = PanelApp()
+    async with app.run_test() as pilot:
+        panel, run = await _new_run(app, pilot)
+        start = datetime(2026, 1, 1)
+
+        _deliver(
+            panel,
+            run,
+            [
+                [_span(run, start, "grandchild", "child", 2)],
+                [_span(run, start, "child", "parent", 1)],
+                [_span(run, start, "parent", ARTIFICIAL_ROOT_ID, 0)],
+            ],
+        )
+
+        assert panel._spans_tree is not None
+        (parent,) = panel._spans_tree.root.children
+        assert parent.data == "parent"
+        assert [c.data for c in parent.children] == ["child"]
+        assert [c.data for c in parent.children[0].children] == ["grandchild"]
+        _assert_matches_rebuild(panel)
+
+
+async def test_parent_and_child_in_same_flush() -> None:
+    app = PanelApp()
+    async with app.run_test() as pilot:
+        panel, run = await _new_run(app, pilot)
+        start = datetime(2026, 1, 1)
+
+        _deliver(
+            panel,
+            run,
+            [
+                [
+                    _span(run, start, "second", "parent", 2),
+                    _span(run, start, "first", "parent", 1),
+                    _span(run, start, "parent", ARTIFICIAL_ROOT_ID, 0),
+                ]
+            ],
+        )
+
+        assert panel._spans_tree is not None
+        (parent,) = panel._spans_tree.root.children
+        assert [c.data for c in parent.children] == ["first", "second"]
+        _assert_matches_rebuild(panel)
@@ -0,0 +1,100 @@
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from uipath.dev.models.execution import ExecutionMode, ExecutionRun
+from uipath.dev.services import run_service
+from uipath.dev.services.run_service import RUN_UPDATE_INTERVAL, RunService
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> list[float]:
+    """Freeze the coalescing clock; tests advance it by assigning clock[0]."""
+    now = [1000.0]
+    # Replace only the module's reference; the event loop still needs real time
+    monkeypatch.setattr(run_service, "time", SimpleNamespace(monotonic=lambda: now[0]))
+    return now
+
+
+def _service(updates: list[ExecutionRun]) -> RunService:
+    return RunService(
+        runtime_factory=MagicMock(),
+        trace_manager=MagicMock(),
+        on_run_updated=updates.append,
+    )
+
+
+def test_schedule_without_observer_is_noop() -> None:
+    service = RunService(runtime_factory=MagicMock(), trace_manager=MagicMock())
+    run = ExecutionRun("main", {}, ExecutionMode.RUN)
+
+    service._schedule_run_updated(run)
+
+    assert not service._dirty_runs
+    assert service._flush_handle is None
+
+
+def test_quiet_run_emits_on_leading_edge(clock: list[float]) -> None:
+    updates: list[ExecutionRun] = []
+    service = _service(updates)
+    run = ExecutionRun("main", {}, ExecutionMode.RUN)
+    service.register_run(run)
+    clock[0] += RUN_UPDATE_INTERVAL
+
+    service._schedule_run_updated(run)
+
+    assert updates == [run, run]
+    assert not service._dirty_runs
+    assert service._flush_handle is None
+
+
+def test_without_running_loop_emits_directly(clock: list[float]) -> None:
+    updates: list[ExecutionRun] = []
+    service = _service(updates)
+    run = ExecutionRun("main", {}, ExecutionMode.RUN)
+    service.register_run(run)
+    # Still inside the interval, so only the missing loop forces the emit
+    clock[0] += RUN_UPDATE_INTERVAL / 2
+
+    service._schedule_run_updated(run)
+
+    assert updates == [run, run]
+    assert service._last_emit[run.id] == clock[0]
+    assert not service._dirty_runs
+    assert service._flush_handle is None
+
+
+async def test_burst_is_coalesced_into_one_update(clock: list[float]) -> None:
+    updates: list[ExecutionRun] = []
+    service = _service(updates)
+    run = ExecutionRun("main", {}, ExecutionMode.RUN)
+    service.register_run(run)
+
+    for _ in range(10):
+        service._schedule_run_updated(run)
+
+    assert updates == [run]
+    assert service._dirty_runs == {run.id}
+    assert service._flush_handle is not None
+
+    await asyncio.sleep(RUN_UPDATE_INTERVAL * 2)
+
+    assert updates == [run, run]
+    assert not service._dirty_runs
+    assert service._flush_handle is None
+
+
+async def test_immediate_update_drops_pending_one(clock: list[float]) -> None:
+    updates: list[ExecutionRun] = []
+    service = _service(updates)
+    run = ExecutionRun("main", {}, ExecutionMode.RUN)
+    service.register_run(run)
+    service._schedule_run_updated(run)
+    assert service._dirty_runs == {run.id}
+
+    service._emit_run_updated(run)
+    await asyncio.sleep(RUN_UPDATE_INTERVAL * 2)
+
+    assert updates == [run, run]